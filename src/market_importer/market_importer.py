@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -17,16 +18,21 @@ from runtime.operator_definition import (
     FolderSlot,
 )
 
+# Checked with a single str.endswith call per directory entry
+SUPPORTED_EXTENSIONS = (".parquet", ".csv")
+
 
 class MarketImporter(Operator):
 
     meta_name: str = "market_importer"
-    meta_labels: tuple[str] = {OperatorTags.IMPORTER, OperatorTags.TIMESERIES}
+    meta_labels: frozenset[str] = frozenset(
+        {OperatorTags.IMPORTER, OperatorTags.TIMESERIES}
+    )
 
     meta_input_slots: tuple[SlotDefinition] = (
         SlotDefinition(
             name="raw",
-            tags={OperatorTags.RAW, OperatorTags.TIMESERIES},
+            tags=frozenset({OperatorTags.RAW, OperatorTags.TIMESERIES}),
             required=True,
             multiple=False,
             type=IoType.FOLDER,
@@ -35,7 +41,7 @@ class MarketImporter(Operator):
     meta_output_slots: tuple[SlotDefinition] = (
         SlotDefinition(
             name="timeseries",
-            tags={OperatorTags.TIMESERIES},
+            tags=frozenset({OperatorTags.TIMESERIES}),
             multiple=True,
             type=IoType.DATAFRAME,
         ),
@@ -48,7 +54,7 @@ class MarketImporter(Operator):
         super().__init__(input_data, options)
 
         self.runtime = None
-        if (slot := self.input_data[0] is None) or not isinstance(slot, FolderSlot):
+        if (slot := self.input_data[0]) is None or not isinstance(slot, FolderSlot):
             raise ValueError("The input data must be a folder.")
         self.root_folder_path: Path = slot.get_path()
 
@@ -72,28 +78,46 @@ class MarketImporter(Operator):
         pair_files = []
         non_pair_files = []
 
-        for subpath in self.root_folder_path.iterdir():
-            if subpath.is_dir() and is_valid_currency_pair(subpath.name):
-                matching_subfolders.append(subpath)
-            elif subpath.is_file() and subpath.suffix in (".parquet", ".csv"):
-                if is_valid_currency_pair(subpath.stem):
-                    pair_files.append(subpath)
+        # scandir reuses the file type reported by readdir, so classifying an entry doesn't need a stat call
+        # (symlinks are still followed, those are the only entries that get stat-ed)
+        with os.scandir(self.root_folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir():
+                    if is_valid_currency_pair(name):
+                        matching_subfolders.append(entry.path)
+                    continue
+
+                if not name.endswith(SUPPORTED_EXTENSIONS) or not entry.is_file():
+                    continue
+                stem = name[: name.rindex(".")]
+                if not stem:
+                    continue
+                if is_valid_currency_pair(stem):
+                    pair_files.append(entry.path)
                 else:
-                    non_pair_files.append(subpath)
-
-        self.logger.debug(f"Found {len(matching_subfolders)} matching subfolders.")
-        self.logger.debug(f"Found {len(pair_files)} pair files.")
-        self.logger.debug(f"Found {len(non_pair_files)} non-pair files.")
-
-        max_length = max(len(matching_subfolders), len(pair_files), len(non_pair_files))
-        if len(matching_subfolders) == max_length:
-            self.logger.info("Treating it as a folder of datasets.")
-            self.import_strategy = MultipleFolderImporter(matching_subfolders)
-        elif len(pair_files) == max_length:
-            self.logger.info("Treating it as files of pairs.")
-            self.import_strategy = MultipleFilesImporter(pair_files)
-        elif len(non_pair_files) == max_length:
-            self.logger.info("Treating it as files of non-pairs.")
-            self.import_strategy = MultipleFilesImporter(non_pair_files)
-        else:
-            raise ValueError("The folder structure is not consistent.")
+                    non_pair_files.append(entry.path)
+
+        self.logger.debug("Found %d matching subfolders.", len(matching_subfolders))
+        self.logger.debug("Found %d pair files.", len(pair_files))
+        self.logger.debug("Found %d non-pair files.", len(non_pair_files))
+
+        # Ties are resolved in declaration order, max returns the first of the largest candidates
+        candidates = (
+            (
+                matching_subfolders,
+                MultipleFolderImporter,
+                "Treating it as a folder of datasets.",
+            ),
+            (pair_files, MultipleFilesImporter, "Treating it as files of pairs."),
+            (
+                non_pair_files,
+                MultipleFilesImporter,
+                "Treating it as files of non-pairs.",
+            ),
+        )
+        paths, strategy, message = max(
+            candidates, key=lambda candidate: len(candidate[0])
+        )
+        self.logger.info(message)
+        self.import_strategy = strategy(paths)
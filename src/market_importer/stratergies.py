@@ -1,22 +1,15 @@
+import json
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Generator
 
-import pandas as pd
-
 from runtime.enums import is_valid_currency_pair
 from runtime.operator_definition import DataframeSlot
 
 
-def is_forex(literal: str, dictionary: set[str]) -> bool:
-    """
-    Check if a folder name can be split into exactly two valid 3-char words from the dictionary.
-    """
-    literal = literal.upper()
-    if len(literal) != 6:
-        return False
-    return literal[:3] in dictionary and literal[3:] in dictionary
-
-
 class ImportStrategy(ABC):
     def __init__(self, base):
         self.base = base
@@ -34,34 +27,79 @@ class MultipleFolderImporter(ImportStrategy):
 
 
 class MultipleFilesImporter(ImportStrategy):
-    """Import datasets from a list of files."""
+    """Import datasets from a list of files.
 
-    def __init__(self, base):
+    Files are read on a thread pool, pyarrow releases the GIL while reading and decompressing, so reads overlap
+    without having to pickle the dataframes back from another process. Only `max_workers` files are read ahead,
+    keeping the memory bounded regardless of the number of files.
+    """
+
+    def __init__(self, base, max_workers: int | None = None):
         super().__init__(base)
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
 
     def collect_iter(self) -> Generator[DataframeSlot, None, None]:
-        for file in self.base:
-            file_import = SingleFileImporter(file)
-            for dfs in file_import.collect_iter():
-                yield dfs
+        files = iter(self.base)
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending = deque(
+                executor.submit(_read_file, file)
+                for file in islice(files, self.max_workers)
+            )
+            while pending:
+                slots = pending.popleft().result()
+                # Refill the window before handing the result over, so the next read runs while it's consumed
+                pending.extend(
+                    executor.submit(_read_file, file) for file in islice(files, 1)
+                )
+                yield from slots
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+def _read_file(file) -> list[DataframeSlot]:
+    return list(import_file(file))
+
+
+def import_file(path: str) -> Generator[DataframeSlot, None, None]:
+    """Import the datasets contained in a single file.
+
+    Kept as a plain function so bulk importers can call it directly for every file instead of creating a
+    strategy object each time.
+    """
+    # Paths are handed over as plain strings, building Path objects for every file is not worth it
+    file_name, extension = os.path.splitext(os.path.basename(path))
+    symbol = file_name.upper()
+
+    metadata = {"symbol": symbol}
+
+    if is_valid_currency_pair(symbol):
+        metadata["forex_base"] = (symbol[:3],)
+        metadata["forex_counter"] = symbol[3:]
+        metadata["family"] = "forex"
+
+    if extension == ".parquet":
+        import pyarrow.parquet as pq  # Deferred, importing pyarrow/pandas dominates the startup time
+
+        # memory_map only changes how pyarrow opens the file, as a memory map instead of buffered reads.
+        # Converting with self_destruct releases each Arrow column as soon as it's copied into pandas, instead of
+        # holding both full copies of the dataset in memory at the same time. Columns are still copied (no
+        # split_blocks), so the resulting frame stays writable
+        table = pq.read_table(path, memory_map=True)
+        # Read before the conversion destroys the table, pd.read_parquet restores attrs from the same key
+        pandas_attrs = (table.schema.metadata or {}).get(b"PANDAS_ATTRS")
+        df = table.to_pandas(self_destruct=True)
+        del table
+        if pandas_attrs is not None:
+            df.attrs = json.loads(pandas_attrs)
+        yield DataframeSlot(df, metadata)
 
 
 class SingleFileImporter(ImportStrategy):
     """Import a single file."""
 
     def collect_iter(self) -> Generator[DataframeSlot, None, None]:
-        symbol = self.base.stem.upper()
-
-        metadata = {"symbol": symbol}
-
-        if is_valid_currency_pair(symbol):
-            metadata["forex_base"] = (symbol[:3],)
-            metadata["forex_counter"] = symbol[3:]
-            metadata["family"] = "forex"
-
-        if self.base.suffix == ".parquet":
-            df = pd.read_parquet(self.base)
-            yield DataframeSlot(df, metadata)
+        return import_file(self.base)
 
 
 class FolderImporter(ImportStrategy):
@@ -1,4 +1,14 @@
+from pathlib import Path
+
+import pandas as pd
+
 from market_importer.market_importer import MarketImporter
+from market_importer.stratergies import (
+    MultipleFilesImporter,
+    MultipleFolderImporter,
+    SingleFileImporter,
+)
+from runtime.operator_definition import FolderSlot
 
 
 def test_success():
@@ -12,3 +22,91 @@ def test_instantiation():
 
     market_importer = MarketImporter(tuple(), options)
     assert market_importer is not None
+
+
+def test_parse_folder_structure_pair_files(tmp_path):
+    """Pair files win over unrelated files and folders"""
+    for name in ("EURUSD.parquet", "gbpusd.csv", "notes.txt"):
+        (tmp_path / name).touch()
+    (tmp_path / "misc").mkdir()
+
+    market_importer = MarketImporter((FolderSlot(tmp_path),), MarketImporter.Options())
+    market_importer.parse_folder_structure()
+
+    assert isinstance(market_importer.import_strategy, MultipleFilesImporter)
+    assert sorted(Path(path).name for path in market_importer.import_strategy.base) == [
+        "EURUSD.parquet",
+        "gbpusd.csv",
+    ]
+
+
+def test_parse_folder_structure_pair_folders(tmp_path):
+    """Folders named after a pair are treated as datasets"""
+    for name in ("EURUSD", "USDJPY", "other"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "data.parquet").touch()
+
+    market_importer = MarketImporter((FolderSlot(tmp_path),), MarketImporter.Options())
+    market_importer.parse_folder_structure()
+
+    assert isinstance(market_importer.import_strategy, MultipleFolderImporter)
+    assert sorted(Path(path).name for path in market_importer.import_strategy.base) == [
+        "EURUSD",
+        "USDJPY",
+    ]
+
+
+def test_single_file_importer_from_string_path(tmp_path):
+    """Files can be imported from plain string paths"""
+    path = tmp_path / "eurusd.parquet"
+    pd.DataFrame({"close": [1.0, 1.1]}).to_parquet(path)
+
+    (slot,) = SingleFileImporter(str(path)).collect_iter()
+
+    assert slot.metadata["symbol"] == "EURUSD"
+    assert slot.metadata["forex_counter"] == "USD"
+    assert slot.get_df()["close"].tolist() == [1.0, 1.1]
+
+
+def test_single_file_importer_frame_is_writable(tmp_path):
+    """Imported frames can be modified in place"""
+    path = tmp_path / "eurusd.parquet"
+    pd.DataFrame({"close": [1.0, 1.1]}).to_parquet(path)
+
+    (slot,) = SingleFileImporter(str(path)).collect_iter()
+    df = slot.get_df()
+    df.loc[0, "close"] = 1.5
+    df["close"] *= 2
+
+    assert df["close"].tolist() == [3.0, 2.2]
+
+
+def test_single_file_importer_keeps_attrs(tmp_path):
+    """DataFrame.attrs stored in the parquet file are restored, as pd.read_parquet does"""
+    path = tmp_path / "eurusd.parquet"
+    df = pd.DataFrame({"close": [1.0, 1.1]})
+    df.attrs = {"source": "broker"}
+    df.to_parquet(path)
+
+    (slot,) = SingleFileImporter(str(path)).collect_iter()
+
+    assert slot.get_df().attrs == {"source": "broker"}
+
+
+def test_multiple_files_importer_keeps_order(tmp_path):
+    """Files read in parallel are yielded in the order they were given"""
+    paths = []
+    for index, name in enumerate(("EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCHF")):
+        path = tmp_path / f"{name}.parquet"
+        pd.DataFrame({"close": [float(index)]}).to_parquet(path)
+        paths.append(str(path))
+
+    slots = list(MultipleFilesImporter(paths, max_workers=2).collect_iter())
+
+    assert [slot.metadata["symbol"] for slot in slots] == [
+        "EURUSD",
+        "GBPUSD",
+        "USDJPY",
+        "AUDUSD",
+        "USDCHF",
+    ]
@@ -3,7 +3,8 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, Type
 
 
-from runtime.operator_definition import Operator
+from runtime.operator_definition import Operator, TaskDefinition
+
 
 class Catalog:
     """Represent a group of algorithms on a single sourcecode.
@@ -21,6 +22,23 @@ class Catalog:
         """Library name (as id)"""
         self.name: str = name
         self.description: str = description
-        self.operators: Dict[str, Type[Operator]] = {op.meta_name: op for op in operators}
+        self.operators: Dict[str, Type[Operator]] = {
+            op.meta_name: op for op in operators
+        }
+
+    def get_operator(self, task: TaskDefinition) -> Type[Operator]:
+        """Return the operator class that can execute the task.
+
+        The registry is built once on init, so a dispatch is a single dict lookup.
+        """
+        if task.library != self.name:
+            raise ValueError(
+                f"The task targets the library '{task.library}' but this catalog is '{self.name}'."
+            )
 
-    def get_operator(self, operation_definition: OperationDefinition):
\ No newline at end of file
+        operator = self.operators.get(task.name)
+        if operator is None:
+            raise ValueError(
+                f"Operator '{task.name}' is not part of the catalog '{self.name}'."
+            )
+        return operator
@@ -1,12 +1,12 @@
 import abc
 import sys
 from enum import StrEnum
-from typing import override
+from typing import ClassVar, override
 
 
 from pydantic import BaseModel, Field, SerializeAsAny
 
-from runtime.operator_definition import JobDefinition
+from runtime.operator_definition import JobDefinition, TaskDefinition
 
 
 # There is a lot of redundancy having to declare a new command on the enum,
@@ -44,6 +44,13 @@ class CommunicationBackend(abc.ABC):
     The communication with the cubelet is done through a request-response pattern.
     """
 
+    # Backends talking to a cubelet that already validates the jobs can skip the validation on our side
+    TRUSTED_SOURCE: ClassVar[bool] = False
+
+    # Requests without data never change, so they are built once instead of on every call
+    _GET_JOB: ClassVar[Message] = Message(command=CommandName.GET_JOB)
+    _CREATE_DATUM: ClassVar[Message] = Message(command=CommandName.CREATE_DATUM)
+
     @abc.abstractmethod
     def _send_message(self, message: Message) -> Message:
         """Sends a message to the cubelet and returns the response."""
@@ -55,10 +62,17 @@ class CommunicationBackend(abc.ABC):
         The None return value should be interpreted as a shutdown signal.
         """
 
-        response = self._send_message(Message(command=CommandName.GET_JOB))
+        response = self._send_message(self._GET_JOB)
         if response.command == CommandName.STOP:
             return None
         elif response.command == CommandName.JOB_DEFINITION:
+            if self.TRUSTED_SOURCE:
+                return JobDefinition.model_construct(
+                    operations=[
+                        TaskDefinition.model_construct(**operation)
+                        for operation in response.data["operations"]
+                    ]
+                )
             job = JobDefinition.model_validate(response.data)
             return job
 
@@ -66,7 +80,7 @@ class CommunicationBackend(abc.ABC):
 
     def create_datum(self):
         """Request the creation of a new empty datum."""
-        response = self._send_message(Message(command=CommandName.CREATE_DATUM))
+        response = self._send_message(self._CREATE_DATUM)
 
         if response.command == CommandName.DATUM_DEFINITION:
             return response.data
@@ -105,7 +119,10 @@ class TerminalCommunicationBackend(CommunicationBackend):
     def _send_message(self, message: Message):
         # If this fails will make the runtime fail as well
         payload = message.model_dump_json()
-        print(f"{self.OUT_SEPARATOR}{payload}")
+        # Single write flushed right away: stdout is block buffered when it's a pipe, so a plain print could keep
+        # the request in the buffer while we wait for the response
+        sys.stdout.write(f"{self.OUT_SEPARATOR}{payload}\n")
+        sys.stdout.flush()
         return self.get_response()
 
     def get_response(self) -> Message:
@@ -127,5 +144,5 @@ class TerminalCommunicationBackend(CommunicationBackend):
         if not line.startswith(self.IN_SEPARATOR):
             return None
 
-        potential_json_literal = line[len(self.IN_SEPARATOR) :].strip()
+        potential_json_literal = line.removeprefix(self.IN_SEPARATOR).strip()
         return Message.model_validate_json(potential_json_literal)
@@ -169,11 +169,15 @@ CURRENCY_CODES = {
 }
 
 
+# Every combination of two codes, it's small enough (~30k strings) to precompute and turns the check into a
+# single set lookup, which matters when scanning folders with a lot of entries.
+CURRENCY_PAIRS = frozenset(
+    base + counter for base in CURRENCY_CODES for counter in CURRENCY_CODES
+)
+
+
 def is_valid_currency_pair(literal: str) -> bool:
     """
     Check if a folder name can be split into exactly two valid 3-char words from the dictionary.
     """
-    literal = literal.upper()
-    if len(literal) != 6:
-        return False
-    return literal[:3] in CURRENCY_CODES and literal[3:] in CURRENCY_CODES
+    return len(literal) == 6 and literal.upper() in CURRENCY_PAIRS
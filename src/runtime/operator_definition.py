@@ -1,12 +1,18 @@
 import abc
 import logging
+from dataclasses import dataclass
 from enum import StrEnum
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
-from pandas import DataFrame
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    # pandas is slow to import and only needed once an operator actually handles dataframes
+    from pandas import DataFrame
+
+_NON_WORD_PATTERN = re.compile(r"\W+")
 
 
 class TaskDefinition(BaseModel):
@@ -54,28 +60,38 @@ class IoType(StrEnum):
     OBJECT = "object"
 
 
-class SlotDefinition(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SlotDefinition:
     """Describes an input/output slot.
 
     Two operators can be connected if they have compatible IoSlot objects.
+    Slots are declared in code as part of the operator metadata, so unlike the definitions received from the
+    cubelet they don't need to go through pydantic validation.
     """
 
-    name: str = Field(default="")
-    tags: set[str] = tuple()
+    name: str = ""
+    tags: frozenset[str] = frozenset()
 
-    required: bool = Field(default=True)
+    required: bool = True
     # Whether the slot expects a list or a single instance of the declared type
-    multiple: bool = Field(default=False)
+    multiple: bool = False
     # What is the underlying data format expected.
-    type: IoType = Field(default=IoType.FOLDER)
+    type: IoType = IoType.FOLDER
+
+    def __post_init__(self):
+        # Accept any iterable of tags, but store them immutable like the rest of the definition
+        object.__setattr__(self, "tags", frozenset(self.tags))
 
 
 class SlotData:
     """Acts as a container for data that is passed between operators.
 
     It hides the details of how the data is stored, allowing for loading data from disk or memory.
+    Slots can be produced in large numbers by importers, so they declare __slots__ to avoid a dict per instance.
     """
 
+    __slots__ = ("read_only",)
+
     def __init__(self, read_only: bool = False):
         self.read_only = read_only
 
@@ -90,6 +106,8 @@ class FolderSlot(SlotData):
     It's the most generic type of SlotData, as it makes no assumptions over the format of the datum.
     """
 
+    __slots__ = ("path",)
+
     def __init__(self, path: pathlike, read_only: bool = False):
         super().__init__(read_only)
         self.path: Path = self.parse_pathlike_folder(path)
@@ -101,7 +119,8 @@ class FolderSlot(SlotData):
         else:
             potential_path = Path(path)
 
-        if not potential_path.exists() or not potential_path.is_dir():
+        # is_dir is already False for missing paths, a separate exists check would only add another stat call
+        if not potential_path.is_dir():
             raise ValueError(
                 f"The provided path '{path}' is not a valid path or does not exist."
             )
@@ -112,9 +131,11 @@ class FolderSlot(SlotData):
 
 
 class DataframeSlot(SlotData):
+    __slots__ = ("df", "is_materialized", "metadata")
+
     def __init__(
         self,
-        df: DataFrame | None,
+        df: "DataFrame | None",
         metadata: dict | None = None,
         read_only: bool = False,
     ):
@@ -124,7 +145,7 @@ class DataframeSlot(SlotData):
 
         self.metadata = dict() if metadata is None else metadata
 
-    def get_df(self) -> DataFrame:
+    def get_df(self) -> "DataFrame":
         if self.df is None:
             raise ValueError(
                 "The dataframe is missing. Ensure the slot contains a valid dataframe before accessing it."
@@ -138,12 +159,15 @@ class Operator(abc.ABC):
     # Metadata about the operator
     meta_name: str = "GenericOperator"
     meta_description: str = ""
-    meta_labels: set[str] = set()
+    meta_labels: frozenset[str] = frozenset()
 
     # Describes the specific I/O shape of the Operator.
     meta_input_slots: tuple[SlotDefinition, ...] = tuple()
     meta_output_slots: tuple[SlotDefinition, ...] = tuple()
 
+    # (position, name) of the required input slots, resolved once per subclass from meta_input_slots
+    _required_input_slots: tuple[tuple[int, str], ...] = tuple()
+
     class Options(BaseModel):
         """An operator can have arbitrary options.
 
@@ -152,6 +176,15 @@ class Operator(abc.ABC):
 
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The slot layout is static, so the instance check only has to look at the required positions
+        cls._required_input_slots = tuple(
+            (position, slot.name)
+            for position, slot in enumerate(cls.meta_input_slots)
+            if slot.required
+        )
+
     def __init__(self, input_data: tuple[SlotData], options: Options):
         # Anz instance is tied to actual data and parameters
         self.input_data = input_data
@@ -163,13 +196,13 @@ class Operator(abc.ABC):
             raise ValueError(
                 f"The number of input slots ({len(input_data)}) does not match the number of required input slots ({len(self.meta_input_slots)})"
             )
-        for slot, data in zip(self.meta_input_slots, input_data):
-            if slot.required and data is None:
-                raise ValueError(f"Slot {slot.name} is required but not provided.")
+        for position, name in self._required_input_slots:
+            if input_data[position] is None:
+                raise ValueError(f"Slot {name} is required but not provided.")
 
     def run(self) -> tuple[SlotData]:
         pass
 
     def get_human_name(self):
         """Return a human-readable name for the operator."""
-        return re.sub(r"\W+", " ", self.meta_name)
+        return _NON_WORD_PATTERN.sub(" ", self.meta_name)
@@ -7,6 +7,7 @@ class Datum:
     Only this class can be actually persisted and retrieved from the disk. Other classes are just wrappers.
     """
 
+    __slots__ = ("commited",)
 
     def __init__(self):
         """Only uncommitted data can be modified."""
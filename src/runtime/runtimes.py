@@ -1,15 +1,13 @@
-import abc
 import logging
 
-import typing
-import asyncio
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
 from runtime.catalog_base import Catalog
 from runtime.communication import CommunicationBackend
 from runtime.operator_definition import JobDefinition
 
+logger = logging.getLogger("Runtime")
+
 
 class DatumDefinition(BaseModel):
     """Describes a datum that can be used in an Operator."""
@@ -18,32 +16,13 @@ class DatumDefinition(BaseModel):
         extra = "allow"
 
 
-class TaskDefinition(BaseModel):
-    """Describes a task that can be executed by the runtime."""
-
-    library: str
-    operator: str
-    version: str
-
-    options: dict = Field(default_factory=dict)  # noqa: intellij bug
-    input_data: list[DatumDefinition] = Field(  # noqa: intellij bug
-        default_factory=list
-    )
-    output_data: list[DatumDefinition] = Field(  # noqa: intellij bug
-        default_factory=list
-    )
-
-    class Config:
-        extra = "allow"
-
-
 class Runtime:
     """Handles the execution of jobs assigned by the cubelet."""
 
     def __init__(self, catalog: Catalog, communication_backend: CommunicationBackend):
         self.catalog: Catalog = catalog
         self.communication_backend: CommunicationBackend = communication_backend
-        self.logger = logging.getLogger("Runtime")
+        self.logger = logger
 
     def start(self):
         """Starts the job execution loop."""
@@ -68,5 +47,8 @@ class Context:
     This API should be very stable, so introducing a layer of indirection will simplify changes.
     """
 
+    # One context is created per task, and it's not meant to hold anything but the runtime reference
+    __slots__ = ("_runtime",)
+
     def __init__(self, runtime: Runtime):
         self._runtime: Runtime = runtime
@@ -0,0 +1,30 @@
+import pytest
+
+from runtime.catalog_base import Catalog
+from runtime.operator_definition import Operator, TaskDefinition
+
+
+class DummyOperator(Operator):
+    meta_name = "dummy"
+
+
+@pytest.fixture
+def catalog():
+    return Catalog(name="test-catalog", operators=[DummyOperator])
+
+
+def test_get_operator(catalog):
+    task = TaskDefinition(name="dummy", library="test-catalog", arguments={})
+    assert catalog.get_operator(task) is DummyOperator
+
+
+def test_get_operator_unknown_operator(catalog):
+    task = TaskDefinition(name="missing", library="test-catalog", arguments={})
+    with pytest.raises(ValueError):
+        catalog.get_operator(task)
+
+
+def test_get_operator_wrong_library(catalog):
+    task = TaskDefinition(name="dummy", library="other-catalog", arguments={})
+    with pytest.raises(ValueError):
+        catalog.get_operator(task)
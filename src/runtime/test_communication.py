@@ -5,12 +5,13 @@ from unittest.mock import MagicMock, patch, Mock
 
 import pytest
 from pydantic import BaseModel
-from src.runtime.communication import (
+from runtime.communication import (
     CommunicationBackend,
     Message,
     CommandName,
     TerminalCommunicationBackend,
 )
+from runtime.operator_definition import JobDefinition, TaskDefinition
 
 
 def test_model_is_accepted_as_message_data(self):
@@ -46,6 +47,31 @@ class TestCommunicationBackend:
         result = backend.get_job()
         assert result == task_data
 
+    def test_get_job_validates_job_definition(self, backend):
+        job_data = {"operations": [{"name": "op", "library": "lib", "arguments": {}}]}
+        response_message = Message(command=CommandName.JOB_DEFINITION, data=job_data)
+        backend._send_message = Mock(return_value=response_message)
+
+        job = backend.get_job()
+        assert isinstance(job, JobDefinition)
+        assert job.operations[0] == TaskDefinition(
+            name="op", library="lib", arguments={}
+        )
+
+    def test_get_job_trusted_source_skips_validation(self):
+        class TrustedBackend(self.ConcreteCommunicationBackend):
+            TRUSTED_SOURCE = True
+
+        backend = TrustedBackend()
+        # The arguments are not a dict, so this payload would be rejected if it was validated
+        job_data = {"operations": [{"name": "op", "library": "lib", "arguments": []}]}
+        response_message = Message(command=CommandName.JOB_DEFINITION, data=job_data)
+        backend._send_message = Mock(return_value=response_message)
+
+        job = backend.get_job()
+        assert isinstance(job, JobDefinition)
+        assert job.operations[0].arguments == []
+
     def test_create_datum_returns_datum_info(self, backend):
         datum_data = {"datum_id": 1}
         response_message = Message(command=CommandName.DATUM_DEFINITION, data=datum_data)
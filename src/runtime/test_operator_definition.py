@@ -0,0 +1,38 @@
+import pytest
+
+from runtime.operator_definition import Operator, SlotDefinition, SlotData
+
+
+class TwoSlotOperator(Operator):
+    meta_name = "two_slot_operator"
+    meta_input_slots = (
+        SlotDefinition(name="optional", required=False),
+        SlotDefinition(name="mandatory", required=True),
+    )
+
+
+def test_required_slots_resolved_per_subclass():
+    assert TwoSlotOperator._required_input_slots == ((1, "mandatory"),)
+
+
+def test_missing_optional_slot_is_accepted():
+    operator = TwoSlotOperator((None, SlotData()), Operator.Options())
+    assert operator.input_data[0] is None
+
+
+def test_missing_required_slot_is_rejected():
+    with pytest.raises(ValueError, match="mandatory"):
+        TwoSlotOperator((SlotData(), None), Operator.Options())
+
+
+def test_wrong_number_of_slots_is_rejected():
+    with pytest.raises(ValueError):
+        TwoSlotOperator((SlotData(),), Operator.Options())
+
+
+def test_slot_definition_is_immutable():
+    slot = SlotDefinition(name="raw", tags={"raw", "timeseries"})
+
+    assert slot.tags == frozenset({"raw", "timeseries"})
+    with pytest.raises(AttributeError):
+        slot.required = False